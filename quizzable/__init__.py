@@ -22,11 +22,20 @@ Python with great ease.
 """
 
 import random as _random
-from copy import deepcopy as _deepcopy
+from operator import methodcaller as _methodcaller
 from typing import Union as _Union
 
 from . import exceptions as _exceptions
 
+# pre-bound RNG helpers to avoid a module attribute lookup per call in hot paths
+_choice = _random.choice
+_choices = _random.choices
+_getrandbits = _random.getrandbits
+_sample = _random.sample
+_shuffle = _random.shuffle
+
+_to_dict = _methodcaller("to_dict")
+
 
 class Question:
     """A generic question object with a term, answer, and type.
@@ -39,6 +48,12 @@ class Question:
     * `**kwargs`: other question data (e.g. `options`, `definition`, etc.)
     """
 
+    __slots__ = ("_type", "term", "answer", "prompt", "_extra")
+
+    # extra fields (beyond term/answer/prompt) each question type contributes
+    # to its dictionary representation
+    _FIELDS = ()
+
     def __init__(
         self,
         _type: str,
@@ -54,13 +69,7 @@ class Question:
         if type(term) is list:
             prompt_term = ", ".join(term)
         self.prompt = prompt.format(term=prompt_term)
-        self._data = {
-            "_type": _type,
-            "term": term,
-            "answer": answer,
-            "prompt": self.prompt,
-            **kwargs,
-        }
+        self._extra = kwargs
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -69,8 +78,11 @@ class Question:
         ## Parameters
         * `data`: dictionary containing question data.
         """
-        data_copy = _deepcopy(data)
         try:
+            get_question = _QUESTION_CTORS.get(data["_type"])
+            if get_question is not None:
+                return get_question(data)
+            data_copy = dict(data)
             _type = data_copy.pop("_type")
             term = data_copy.pop("term")
             answer = data_copy.pop("answer")
@@ -84,7 +96,17 @@ class Question:
 
     def to_dict(self):
         """Returns a dictionary representation of the question."""
-        return self._data
+        data = {
+            "_type": self._type,
+            "term": self.term,
+            "answer": self.answer,
+            "prompt": self.prompt,
+        }
+        for field in self._FIELDS:
+            data[field] = getattr(self, field)
+        if self._extra:
+            data.update(self._extra)
+        return data
 
 
 class MCQQuestion(Question):
@@ -116,8 +138,12 @@ class MCQQuestion(Question):
     * `answer` is correct choice out of `options`.
     """
 
+    __slots__ = ("options",)
+
+    _FIELDS = ("options",)
+
     def __init__(self, term: str, options: list[str], answer: str, prompt="{term}"):
-        super().__init__("mcq", term, answer, prompt, options=options)
+        super().__init__("mcq", term, answer, prompt)
         self.options = options
 
 
@@ -142,6 +168,8 @@ class FRQQuestion(Question):
     * `answer` is the response that will be accepted as correct given the user's prompt.
     """
 
+    __slots__ = ()
+
     def __init__(self, term: str, answer: str, prompt="{term}"):
         super().__init__("frq", term, answer, prompt)
 
@@ -171,8 +199,12 @@ class TrueFalseQuestion(Question):
     * `answer` is the actual definition that matches with the given `prompt`, or term.
     """
 
+    __slots__ = ("definition",)
+
+    _FIELDS = ("definition",)
+
     def __init__(self, term: str, definition: str, answer: bool, prompt="{term}"):
-        super().__init__("tf", term, answer, prompt, definition=definition)
+        super().__init__("tf", term, answer, prompt)
         self.definition = definition
 
 
@@ -216,19 +248,41 @@ class MatchQuestion(Question):
     * `answer` maps the terms `term` to their actual definitions `definitions`.
     """
 
+    __slots__ = ("definitions",)
+
+    _FIELDS = ("definitions",)
+
     def __init__(
         self, term: str, definitions: list[str], answer: dict[str, str], prompt="{term}"
     ):
-        super().__init__("match", term, answer, prompt, definitions=definitions)
+        super().__init__("match", term, answer, prompt)
         self.definitions = definitions
 
 
+_QUESTION_CTORS = {
+    "mcq": lambda data: MCQQuestion(
+        data["term"], data["options"], data["answer"], data.get("prompt", "{term}")
+    ),
+    "frq": lambda data: FRQQuestion(
+        data["term"], data["answer"], data.get("prompt", "{term}")
+    ),
+    "tf": lambda data: TrueFalseQuestion(
+        data["term"], data["definition"], data["answer"], data.get("prompt", "{term}")
+    ),
+    "match": lambda data: MatchQuestion(
+        data["term"], data["definitions"], data["answer"], data.get("prompt", "{term}")
+    ),
+}
+
+
 class Quiz:
     """An arbitrary quiz object."""
 
+    __slots__ = ("questions", "_data")
+
     def __init__(self, questions):
         self.questions = questions
-        self._data = [q.to_dict() for q in self.questions]
+        self._data = None
 
     @classmethod
     def from_data(cls, data: list):
@@ -275,34 +329,27 @@ class Quiz:
         ]
         ```
         """
+        if self._data is None:
+            self._data = list(map(_to_dict, self.questions))
         return self._data
 
+    def check_answers(self, answers: list):
+        """Checks `answers` against all of the quiz's questions in one pass.
+        Returns a tuple of two parallel lists: whether each answer was correct,
+        and the correct answer to each question.
 
-def _get_term_and_def(terms, term, answer_with="def"):
-    """(for internal package use) retrieve a term and definition based on `answer_with`."""
-    reverse = False
-    if answer_with == "both":
-        reverse = _random.random() < 0.5
-    elif answer_with == "term":
-        reverse = True
-    if reverse:
-        return terms[term], term
-    return term, terms[term]
-
-
-def _get_random_terms(terms, n_terms=1):
-    """(for internal package use) retrieve `n_terms` terms from `terms`."""
-    terms_copy = _deepcopy(terms)
-    random_terms = []
-    for i in range(n_terms):
-        possible_terms = list(terms_copy.keys())
-        try:
-            random_term = _random.choice(possible_terms)
-        except IndexError:
-            return
-        random_terms.append(random_term)
-        del terms_copy[random_term]
-    return random_terms
+        ## Parameters
+        * `answers`: list of answers, one per question, in question order.
+        """
+        correct = [q.answer == answer for q, answer in zip(self.questions, answers)]
+        return correct, [q.answer for q in self.questions]
+
+
+def _get_random_terms(keys, n_terms=1):
+    """(for internal package use) retrieve `n_terms` distinct terms from `keys`."""
+    if n_terms > len(keys):
+        return
+    return _sample(keys, n_terms)
 
 
 class Terms:
@@ -333,20 +380,39 @@ class Terms:
     * `get_quiz`: get a quiz consisting of different types of questions randomly generated from `self`
     """
 
+    __slots__ = ("_data", "_keys_cache")
+
     def __init__(self, data: dict[str, str]):
         self._data = data
+        self._keys_cache = None
 
     def to_dict(self):
         return self._data
 
+    def _keys(self):
+        """(for internal package use) cached list of terms, rebuilt after mutation."""
+        if self._keys_cache is None:
+            self._keys_cache = list(self._data)
+        return self._keys_cache
+
+    def _remove(self, terms):
+        """(for internal package use) delete several terms, invalidating the key cache once."""
+        for term in terms:
+            self._data.pop(term, None)
+        self._keys_cache = None
+
     def __getitem__(self, term):
         return self._data[term]
 
     def __setitem__(self, term, definition):
+        if self._keys_cache is not None and term not in self._data:
+            self._keys_cache.append(term)
         self._data[term] = definition
 
     def __delitem__(self, term):
         del self._data[term]
+        if self._keys_cache is not None:
+            self._keys_cache.remove(term)
 
     def __len__(self):
         return len(self._data)
@@ -360,11 +426,17 @@ class Terms:
         ## Parameters
         * `answer_with = "def"`: can be `"term"`, `"def"`, or `"both"`; how the question should be answered.
         """
-        terms_copy = _deepcopy(self._data)
-        for term in self:
-            new_term, new_def = _get_term_and_def(self._data, term, answer_with)
-            terms_copy[new_term] = new_def
-        return Terms(terms_copy)
+        if answer_with == "term":
+            return Terms({v: k for k, v in self._data.items()})
+        if answer_with == "both":
+            flips = _getrandbits(len(self._data)) if self._data else 0
+            return Terms(
+                {
+                    (v if flips >> i & 1 else k): (k if flips >> i & 1 else v)
+                    for i, (k, v) in enumerate(self._data.items())
+                }
+            )
+        return Terms(dict(self._data))
 
     def get_frq_question(self, prompt="{term}", **kwargs):
         """Returns an `FRQQuestion` object with a random FRQ-format question generated from `terms`.
@@ -372,8 +444,8 @@ class Terms:
         ## Parameters
         * `prompt = "{term}"`: question prompt (use `"{term}"` to reference question term in custom prompts)
         """
-        term = _get_random_terms(self._data)
-        return FRQQuestion(term=term[0], answer=self[term[0]], prompt=prompt)
+        term = _choice(self._keys())
+        return FRQQuestion(term=term, answer=self._data[term], prompt=prompt)
 
     def get_mcq_question(self, n_options=4, prompt="{term}", **kwargs):
         """Returns an `MCQQuestion` object with a random MCQ-format question generated from `terms`.
@@ -385,23 +457,26 @@ class Terms:
         if (not n_options) or (n_options > len(self)):
             raise _exceptions.InvalidOptionsError(n_options)
 
-        options = _get_random_terms(self._data, n_options)
-        term = _random.choice(options)
-        answer_choices = [self[option] for option in options]
+        options = _get_random_terms(self._keys(), n_options)
+        term = _choice(options)
+        answer_choices = [self._data[option] for option in options]
         return MCQQuestion(
-            term=term, options=answer_choices, answer=self[term], prompt=prompt
+            term=term, options=answer_choices, answer=self._data[term], prompt=prompt
         )
 
-    def get_true_false_question(self, prompt="{term}", **kwargs):
+    def get_true_false_question(self, prompt="{term}", flip=None, **kwargs):
         """Returns a `TrueFalseQuestion` object with a random True-or-false format question generated from `terms`.
 
         ## Parameters
         * `prompt = "{term}"`: question prompt (use `"{term}"` to reference question term in custom prompts)
+        * `flip = None`: pre-drawn coin flip deciding whether the definition is mismatched (drawn here if `None`)
         """
-        term = _get_random_terms(self._data, 2)
-        definition, answer = self[term[0]], True
-        if _random.random() < 0.5:
-            definition, answer = self[term[1]], False
+        term = _get_random_terms(self._keys(), 2)
+        if flip is None:
+            flip = bool(_getrandbits(1))
+        definition, answer = self._data[term[0]], True
+        if flip:
+            definition, answer = self._data[term[1]], False
         return TrueFalseQuestion(
             term=term[0], definition=definition, answer=answer, prompt=prompt
         )
@@ -416,12 +491,10 @@ class Terms:
         if (not n_terms) or (n_terms > len(self)):
             raise _exceptions.InvalidTermsError(n_terms)
 
-        term = _get_random_terms(self._data, n_terms)
-        definitions = []
-        for t in term:
-            definitions.append(self[t])
-        answer = dict(zip(term, definitions))
-        _random.shuffle(definitions)
+        term = _get_random_terms(self._keys(), n_terms)
+        answer = {t: self._data[t] for t in term}
+        definitions = list(answer.values())
+        _shuffle(definitions)
         return MatchQuestion(
             term=term, definitions=definitions, answer=answer, prompt=prompt
         )
@@ -444,20 +517,33 @@ class Terms:
         * `prompt = "{term}"`: question prompt (use `"{term}"` to reference question term in custom prompts)
         * `prompts = {}`: prompt map to define specific prompts for specific questions
         """
-        quiz_types = {
-            "mcq": self.get_mcq_question,
-            "frq": self.get_frq_question,
-            "tf": self.get_true_false_question,
-            "match": self.get_match_question,
-        }
+        return self._get_question(
+            _choice(types),
+            n_options=n_options,
+            n_terms=n_terms,
+            prompt=prompt,
+            prompts=prompts,
+        )
+
+    def _get_question(
+        self,
+        question_type,
+        n_options=4,
+        n_terms=5,
+        prompt="{term}",
+        prompts: dict = {},
+        flip=None,
+    ):
+        """(for internal package use) generate a question of type `question_type`."""
         try:
-            question_type = _random.choice(types)
             if question_type in prompts:
                 prompt = prompts[question_type]
-            get_question = quiz_types[question_type]
+            get_question = _QUESTION_DISPATCH[question_type]
         except KeyError as e:
             raise _exceptions.InvalidQuestionError(e.args[0])
-        return get_question(prompt=prompt, n_options=n_options, n_terms=n_terms)
+        return get_question(
+            self, prompt=prompt, n_options=n_options, n_terms=n_terms, flip=flip
+        )
 
     def get_quiz(
         self,
@@ -486,20 +572,36 @@ class Terms:
 
         questions = []
         terms_copy = self.get_terms(answer_with)
+        remaining = len(terms_copy._data)
+        threshold = max(
+            n_terms if "match" in types else 0,
+            n_options if "mcq" in types else 0,
+            2 if "tf" in types else 1,
+        )
+        chosen_types = _choices(types, k=length)
+        flips = _getrandbits(length) if "tf" in types else 0
         for i in range(length):
-            question = terms_copy.get_random_question(
-                types,
+            question = terms_copy._get_question(
+                chosen_types[i],
                 n_options=n_options,
                 n_terms=n_terms,
                 prompt=prompt,
                 prompts=prompts,
+                flip=bool(flips >> i & 1),
             )
             questions.append(question)
-            if type(question.term) is list:
-                for t in question.term:
-                    del terms_copy[t]
-            else:
-                del terms_copy[question.term]
-            if (len(terms_copy) < n_terms) or (len(terms_copy) < n_options):
+            used = question.term if type(question.term) is list else (question.term,)
+            terms_copy._remove(used)
+            remaining -= len(used)
+            if remaining < threshold:
                 terms_copy = self.get_terms(answer_with)
+                remaining = len(terms_copy._data)
         return Quiz(questions)
+
+
+_QUESTION_DISPATCH = {
+    "mcq": Terms.get_mcq_question,
+    "frq": Terms.get_frq_question,
+    "tf": Terms.get_true_false_question,
+    "match": Terms.get_match_question,
+}
@@ -9,40 +9,60 @@ from ..quizzable import (
     exceptions,
 )
 
+_QUIZ_DATA = [
+    {
+        "_type": "frq",
+        "term": "A type of language that forms due to extensive contact between different groups of people",
+        "answer": "Pidgin",
+        "prompt": "A type of language that forms due to extensive contact between different groups of people",
+    },
+    {
+        "_type": "mcq",
+        "term": "The blending of multiple aspects of culture to form a unique identity.",
+        "options": [
+            "Syncretism",
+            "Assimilation,",
+            "Acculturation",
+        ],
+        "answer": "Syncretism",
+        "prompt": "The blending of multiple aspects of culture to form a unique identity.",
+    },
+    {
+        "_type": "tf",
+        "term": "Anything that brings a people together.",
+        "definition": "Centrifugal force",
+        "answer": False,
+        "prompt": "Anything that brings a people together.",
+    },
+]
+
+_QUESTION_DATA = {
+    "_type": "mcq",
+    "term": "A state divided into several regions with some degree of autonomy under one government.",
+    "options": [
+        "Unitary state",
+        "Multi-state nation",
+        "Federal state",
+        "Nation state",
+    ],
+    "answer": "Federal state",
+    "prompt": "A state divided into several regions with some degree of autonomy under one government.",
+}
+
+_BAD_QUESTION_DATA = {
+    "_type": "mcq",
+    "term": "A state divided into several regions with some degree of autonomy under one government.",
+}
+
 
 class TestQuiz:
     """Test functions/methods of the `Quiz` class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def data(self):
         """Sample data representation of a basic 3-question quiz."""
 
-        return [
-            {
-                "_type": "frq",
-                "term": "A type of language that forms due to extensive contact between different groups of people",
-                "answer": "Pidgin",
-                "prompt": "A type of language that forms due to extensive contact between different groups of people",
-            },
-            {
-                "_type": "mcq",
-                "term": "The blending of multiple aspects of culture to form a unique identity.",
-                "options": [
-                    "Syncretism",
-                    "Assimilation,",
-                    "Acculturation",
-                ],
-                "answer": "Syncretism",
-                "prompt": "The blending of multiple aspects of culture to form a unique identity.",
-            },
-            {
-                "_type": "tf",
-                "term": "Anything that brings a people together.",
-                "definition": "Centrifugal force",
-                "answer": False,
-                "prompt": "Anything that brings a people together.",
-            },
-        ]
+        return _QUIZ_DATA
 
     @pytest.fixture
     def quiz(self):
@@ -82,35 +102,28 @@ class TestQuiz:
 
         assert quiz.to_data() == data
 
+    def test_check_answers(self, quiz):
+        """Checks if `Quiz.check_answers()` grades every question in one pass."""
+
+        correct, answer_key = quiz.check_answers(["Pidgin", "Assimilation,", False])
+        assert correct == [True, False, True]
+        assert answer_key == ["Pidgin", "Syncretism", False]
+
 
 class TestQuestion:
     """Test functions/methods of the `Question` class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def data(self):
         """Sample data representation of the `question` fixture."""
 
-        return {
-            "_type": "mcq",
-            "term": "A state divided into several regions with some degree of autonomy under one government.",
-            "options": [
-                "Unitary state",
-                "Multi-state nation",
-                "Federal state",
-                "Nation state",
-            ],
-            "answer": "Federal state",
-            "prompt": "A state divided into several regions with some degree of autonomy under one government.",
-        }
+        return _QUESTION_DATA
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def bad_data(self):
         """Sample incomplete data for a quiz question."""
 
-        return {
-            "_type": "mcq",
-            "term": "A state divided into several regions with some degree of autonomy under one government.",
-        }
+        return _BAD_QUESTION_DATA
 
     @pytest.fixture
     def question(self):
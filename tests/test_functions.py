@@ -54,6 +54,15 @@ class TestFunctions:
         except exceptions.InvalidOptionsError:
             assert True
 
+    def test_get_mcq_question_answer_position(self, terms):
+        """Test that the correct answer's position among the options varies across MCQs."""
+
+        positions = set()
+        for _ in range(100):
+            mcq = terms.get_mcq_question(4)
+            positions.add(mcq.options.index(mcq.answer))
+        assert len(positions) > 1
+
     def test_get_true_false_question(self, terms):
         """Test that `get_true_false_question` returns a `TrueFalseQuestion` with a term, a definition, and answer."""
 